@@ -14,14 +14,69 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, time
 from typing import Dict, List, Tuple, Optional, Union
-import yfinance as yf
-import requests
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import OrderedDict
 import pickle
+import json
 import os
+import time as _time
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# yfinance drags in a heavy dependency tree (lxml, requests-cache, ...)
+# that costs hundreds of ms at import; defer it until the first network
+# call so cache-served workloads never pay for it
+yf = None
+
+
+def _lazy_yf():
+    """Import yfinance on first use and memoize the module."""
+    global yf
+    if yf is None:
+        import yfinance
+        yf = yfinance
+    return yf
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _clean_ohlc_kernel(high, low, close):
+        """Fused OHLC fixup: swap inverted High/Low, clamp Close into
+        [Low, High], and flag rows with a positive Close to keep.
+
+        One cache-friendly pass instead of several pandas-level sweeps.
+        """
+        n = close.shape[0]
+        keep = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            hi = high[i]
+            lo = low[i]
+            if hi < lo:
+                high[i] = lo
+                low[i] = hi
+                hi, lo = lo, hi
+            c = close[i]
+            if c < lo:
+                close[i] = lo
+            elif c > hi:
+                close[i] = hi
+            keep[i] = close[i] > 0.0
+        return keep
+else:
+    _clean_ohlc_kernel = None
+
 
 class DataPipelineManager:
     """
@@ -72,12 +127,34 @@ class DataPipelineManager:
             }
         }
         
+        # Precompute integer minute-of-day session bounds so the hot
+        # is_market_open check avoids per-call time-object allocation
+        for config in self.markets.values():
+            start = config['session_start']
+            end = config['session_end']
+            config['start_min'] = start.hour * 60 + start.minute
+            config['end_min'] = end.hour * 60 + end.minute
+            config['overnight'] = end < start
+
         # Data sources priority
         self.data_sources = ['yfinance', 'yahoo_backup', 'cache']
         
         # Cache settings
         self.cache_expiry_hours = 24
-        
+        self._expiry_seconds = self.cache_expiry_hours * 3600
+
+        # In-process memoization of yfinance objects and VIX lookups
+        self._ticker_cache: Dict[str, object] = {}
+        self._vix_cache: Dict[datetime, float] = {}
+
+        # Small LRU over fetch_historical_data results so repeated
+        # requests in one process (e.g. walk-forward loops) skip even
+        # the disk-cache deserialization. Cached frames are returned by
+        # reference, not copied, with their buffers marked read-only so
+        # caller mutation fails loudly instead of poisoning later hits.
+        self._mem_cache: 'OrderedDict[tuple, pd.DataFrame]' = OrderedDict()
+        self._mem_cache_size = 32
+
         print(f"DataPipelineManager initialized")
         print(f"Cache directory: {self.cache_dir}")
         print(f"Markets configured: {list(self.markets.keys())}")
@@ -88,47 +165,221 @@ class DataPipelineManager:
         start_date: Union[str, datetime],
         end_date: Union[str, datetime],
         interval: str = '5m',
-        use_cache: bool = True
+        use_cache: bool = True,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Fetch historical market data with caching and fallbacks.
-        
+
         Args:
             market: Market name ('Nikkei', 'DAX', 'Nasdaq')
             start_date: Start date
-            end_date: End date  
+            end_date: End date
             interval: Data interval ('1m', '5m', '15m', '1h', '1d')
             use_cache: Whether to use cached data
-            
+            columns: Optional column projection (e.g. ['Close']); only
+                these columns are read from cached partitions
+
         Returns:
             DataFrame with OHLCV data
         """
-        # Check cache first
+        start_ts = self._to_timestamp(start_date)
+        end_ts = self._to_timestamp(end_date)
+
+        mem_key = (
+            market, start_ts, end_ts, interval,
+            tuple(columns) if columns is not None else None
+        )
         if use_cache:
-            cached_data = self._load_from_cache(market, start_date, end_date, interval)
-            if cached_data is not None:
+            cached = self._mem_cache.get(mem_key)
+            if cached is not None:
+                self._mem_cache.move_to_end(mem_key)
+                return cached
+
+        months = self._month_keys(start_ts, end_ts)
+
+        # Load whatever month partitions are already cached; overlapping
+        # date ranges share partitions, so only truly missing months
+        # trigger a download
+        pieces: Dict[str, pd.DataFrame] = {}
+        missing = list(months)
+        if use_cache:
+            missing = []
+            for month in months:
+                piece = self._load_partition(market, month, interval, columns)
+                if piece is not None:
+                    pieces[month] = piece
+                else:
+                    missing.append(month)
+            if not missing:
                 print(f"Loaded {market} data from cache")
-                return cached_data
-                
-        # Try primary source
-        data = self._fetch_from_yfinance(market, start_date, end_date, interval)
+
+        if missing:
+            # One download spanning the contiguous block of missing months
+            dl_start = pd.Period(missing[0], freq='M').start_time
+            dl_end = pd.Period(missing[-1], freq='M').end_time + timedelta(seconds=1)
+
+            # Try primary source
+            data = self._fetch_from_yfinance(market, dl_start, dl_end, interval)
+
+            # Fallback to alternative tickers if primary fails
+            if data.empty:
+                print(f"Primary ticker failed for {market}, trying alternatives...")
+                data = self._fetch_from_alternatives(market, dl_start, dl_end, interval)
+
+            # Validate and clean data
+            if not data.empty:
+                data = self._validate_data(data, market)
+                data = self._clean_data(data)
+
+                for period, group in data.groupby(data.index.to_period('M')):
+                    month = f"{period.year}{period.month:02d}"
+                    if month in missing:
+                        if use_cache:
+                            self._save_partition(group, market, month, interval)
+                        if columns is not None:
+                            group = group[list(columns)]
+                        pieces[month] = group
+
+        if not pieces:
+            return pd.DataFrame()
+
+        combined = pd.concat(
+            [pieces[month] for month in months if month in pieces]
+        )
+
+        # Trim full-month partitions back to the requested range
+        lo = combined.index.searchsorted(start_ts, side='left')
+        hi = combined.index.searchsorted(end_ts, side='right')
+        result = combined.iloc[lo:hi]
+
+        if use_cache:
+            self._mem_cache[mem_key] = self._freeze(result)
+            if len(self._mem_cache) > self._mem_cache_size:
+                self._mem_cache.popitem(last=False)
+
+        return result
         
-        # Fallback to alternative tickers if primary fails
-        if data.empty:
-            print(f"Primary ticker failed for {market}, trying alternatives...")
-            data = self._fetch_from_alternatives(market, start_date, end_date, interval)
-            
-        # Validate and clean data
-        if not data.empty:
-            data = self._validate_data(data, market)
-            data = self._clean_data(data)
-            
-            # Cache the data
+    def fetch_historical_data_batch(
+        self,
+        markets: List[str],
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        interval: str = '5m',
+        use_cache: bool = True
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch historical data for several markets in one download.
+
+        yfinance supports multi-symbol requests, so fetching all markets
+        in a single call collapses N HTTP round-trips into one.
+
+        Args:
+            markets: Market names to fetch
+            start_date: Start date
+            end_date: End date
+            interval: Data interval ('1m', '5m', '15m', '1h', '1d')
+            use_cache: Whether to use cached data
+
+        Returns:
+            Dict of market name -> OHLCV DataFrame
+        """
+        results: Dict[str, pd.DataFrame] = {}
+
+        # Serve whatever we can from cache first
+        pending = []
+        for market in markets:
             if use_cache:
-                self._save_to_cache(data, market, start_date, end_date, interval)
-                
-        return data
-        
+                cached_data = self._load_from_cache(
+                    market, start_date, end_date, interval
+                )
+                if cached_data is not None:
+                    print(f"Loaded {market} data from cache")
+                    results[market] = cached_data
+                    continue
+            pending.append(market)
+
+        if not pending:
+            return results
+
+        # Single batched download for the remaining markets
+        tickers = {m: self.markets[m]['ticker'] for m in pending}
+
+        yf = _lazy_yf()
+
+        try:
+            batch = yf.download(
+                ' '.join(tickers.values()),
+                start=start_date,
+                end=end_date,
+                interval=interval,
+                group_by='ticker',
+                progress=False,
+                auto_adjust=True
+            )
+        except Exception as e:
+            print(f"Error in batched yfinance download: {e}")
+            batch = pd.DataFrame()
+
+        for market, ticker in tickers.items():
+            if not batch.empty and ticker in batch.columns.get_level_values(0):
+                data = batch[ticker].dropna(how='all')
+            else:
+                data = pd.DataFrame()
+
+            # Fall back to the per-market path (alternative tickers)
+            if data.empty:
+                print(f"Batch fetch failed for {market}, trying alternatives...")
+                data = self._fetch_from_alternatives(
+                    market, start_date, end_date, interval
+                )
+
+            if not data.empty:
+                data = self._validate_data(data, market)
+                data = self._clean_data(data)
+
+                if use_cache:
+                    self._save_to_cache(
+                        data, market, start_date, end_date, interval
+                    )
+
+            results[market] = data
+
+        return results
+
+    def fetch_all_markets(
+        self,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        interval: str = '5m',
+        use_cache: bool = True
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch all configured markets concurrently.
+
+        Each fetch is network-bound, so a thread pool runs the per-market
+        downloads in parallel and wall time drops to the slowest single
+        fetch instead of the sum.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+            interval: Data interval
+            use_cache: Whether to use cached data
+
+        Returns:
+            Dict of market name -> OHLCV DataFrame
+        """
+        with ThreadPoolExecutor(max_workers=len(self.markets)) as pool:
+            futures = {
+                market: pool.submit(
+                    self.fetch_historical_data,
+                    market, start_date, end_date, interval, use_cache
+                )
+                for market in self.markets
+            }
+            return {market: f.result() for market, f in futures.items()}
+
     def fetch_session_data(
         self,
         market: str,
@@ -170,10 +421,13 @@ class DataPipelineManager:
         if data.empty:
             return pd.DataFrame()
             
-        # Filter to exact session
-        mask = (data.index >= session_start) & (data.index <= session_end)
-        session_data = data[mask].copy()
-        
+        # Filter to exact session. The index is sorted (guaranteed by
+        # _clean_data), so binary search + positional slice avoids
+        # materializing a full-length boolean mask and a copy.
+        lo = data.index.searchsorted(session_start, side='left')
+        hi = data.index.searchsorted(session_end, side='right')
+        session_data = data.iloc[lo:hi]
+
         return session_data
         
     def _fetch_from_yfinance(
@@ -184,6 +438,7 @@ class DataPipelineManager:
         interval: str
     ) -> pd.DataFrame:
         """Fetch data from yfinance."""
+        yf = _lazy_yf()
         ticker = self.markets[market]['ticker']
         
         try:
@@ -197,10 +452,11 @@ class DataPipelineManager:
             )
             
             if not data.empty:
-                # Standardize column names
-                data.columns = [col[0] if isinstance(col, tuple) else col 
-                               for col in data.columns]
-                               
+                # Standardize column names (flatten in C, not per-tuple)
+                if isinstance(data.columns, pd.MultiIndex):
+                    data.columns = data.columns.get_level_values(0)
+
+
             return data
             
         except Exception as e:
@@ -214,27 +470,44 @@ class DataPipelineManager:
         end_date: Union[str, datetime],
         interval: str
     ) -> pd.DataFrame:
-        """Try alternative tickers as fallback."""
+        """Try alternative tickers concurrently, taking the first hit."""
         alternative_tickers = self.markets[market]['alternative_tickers']
-        
-        for ticker in alternative_tickers:
-            try:
-                data = yf.download(
-                    ticker,
-                    start=start_date,
-                    end=end_date,
-                    interval=interval,
-                    progress=False
-                )
-                
-                if not data.empty:
-                    print(f"Successfully fetched {market} using {ticker}")
-                    return data
-                    
-            except Exception as e:
-                print(f"Failed to fetch {ticker}: {e}")
-                continue
-                
+
+        if not alternative_tickers:
+            return pd.DataFrame()
+
+        yf = _lazy_yf()
+
+        def download(ticker: str) -> Tuple[str, pd.DataFrame]:
+            return ticker, yf.download(
+                ticker,
+                start=start_date,
+                end=end_date,
+                interval=interval,
+                progress=False
+            )
+
+        # Fire all alternatives at once and return the first non-empty
+        # result instead of paying full latency per sequential miss
+        with ThreadPoolExecutor(max_workers=len(alternative_tickers)) as pool:
+            pending = {pool.submit(download, t) for t in alternative_tickers}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    try:
+                        ticker, data = future.result()
+                    except Exception as e:
+                        print(f"Failed to fetch alternative ticker: {e}")
+                        continue
+
+                    if not data.empty:
+                        print(f"Successfully fetched {market} using {ticker}")
+                        for straggler in pending:
+                            straggler.cancel()
+                        return data
+
         return pd.DataFrame()
         
     def _validate_data(self, data: pd.DataFrame, market: str) -> pd.DataFrame:
@@ -262,18 +535,23 @@ class DataPipelineManager:
         # Check for sufficient data
         if len(data) < 10:
             print(f"Warning: Insufficient data for {market} ({len(data)} bars)")
-            
-        # Validate OHLC relationships
-        invalid_hl = (data['High'] < data['Low']).sum()
+
+        # Validate OHLC relationships and outliers on the raw ndarrays
+        # in one pass, without intermediate Series allocations
+        high, low, close = data[['High', 'Low', 'Close']].values.T
+
+        invalid_hl = np.count_nonzero(high < low)
         if invalid_hl > 0:
             print(f"Warning: {invalid_hl} bars with High < Low")
-            
-        # Check for extreme outliers
-        returns = data['Close'].pct_change()
-        extreme_moves = (returns.abs() > 0.20).sum()  # >20% moves
-        if extreme_moves > 0:
-            print(f"Warning: {extreme_moves} extreme price movements detected")
-            
+
+        # Check for extreme outliers (>20% moves)
+        if len(close) > 1:
+            extreme_moves = np.count_nonzero(
+                np.abs(np.diff(close) / close[:-1]) > 0.20
+            )
+            if extreme_moves > 0:
+                print(f"Warning: {extreme_moves} extreme price movements detected")
+
         return data
         
     def _clean_data(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -292,100 +570,233 @@ class DataPipelineManager:
         # Create a copy
         cleaned = data.copy()
         
-        # Fix OHLC relationships
-        # Ensure High >= Low
-        mask = cleaned['High'] < cleaned['Low']
-        if mask.any():
-            cleaned.loc[mask, ['High', 'Low']] = \
-                cleaned.loc[mask, ['Low', 'High']].values
-                
-        # Ensure Close within High-Low range
-        cleaned['Close'] = cleaned['Close'].clip(
-            lower=cleaned['Low'],
-            upper=cleaned['High']
-        )
-        
-        # Remove obvious errors (prices <= 0)
-        cleaned = cleaned[cleaned['Close'] > 0].copy()
-        
+        if _clean_ohlc_kernel is not None:
+            # Single JIT-compiled pass: swap inverted High/Low, clamp
+            # Close, and drop non-positive closes in one loop
+            high = cleaned['High'].to_numpy(dtype=np.float64, copy=True)
+            low = cleaned['Low'].to_numpy(dtype=np.float64, copy=True)
+            close = cleaned['Close'].to_numpy(dtype=np.float64, copy=True)
+            keep = _clean_ohlc_kernel(high, low, close)
+            cleaned['High'] = high
+            cleaned['Low'] = low
+            cleaned['Close'] = close
+            cleaned = cleaned[keep].copy()
+        else:
+            # NumPy fallback when numba is unavailable
+            # Ensure High >= Low by taking elementwise max/min
+            high = cleaned['High'].values
+            low = cleaned['Low'].values
+            hi = np.maximum(high, low)
+            lo = np.minimum(high, low)
+            cleaned[['High', 'Low']] = np.column_stack([hi, lo])
+
+            # Ensure Close within High-Low range
+            cleaned['Close'] = np.clip(cleaned['Close'].values, lo, hi)
+
+            # Remove obvious errors (prices <= 0)
+            cleaned = cleaned[cleaned['Close'] > 0].copy()
+
         # Handle missing values
         if cleaned.isnull().any().any():
-            # Forward fill first
-            cleaned = cleaned.fillna(method='ffill')
-            # Then backward fill any remaining
-            cleaned = cleaned.fillna(method='bfill')
-            # Drop if still have nulls
-            cleaned = cleaned.dropna()
+            # Forward fill, then backward fill any leading gaps,
+            # then drop rows that are still null
+            cleaned = cleaned.ffill().bfill().dropna()
             
-        # Remove duplicate timestamps
-        cleaned = cleaned[~cleaned.index.duplicated(keep='first')]
-        
-        # Sort by index
-        cleaned = cleaned.sort_index()
-        
+        # Sort first (stable, so the first occurrence of a duplicate
+        # timestamp survives, as before), then drop adjacent duplicates
+        # with one vectorized int64 comparison instead of a hashing pass
+        cleaned = cleaned.sort_index(kind='stable')
+        if len(cleaned) > 1:
+            stamps = cleaned.index.asi8
+            keep = np.empty(len(stamps), dtype=bool)
+            keep[0] = True
+            np.not_equal(stamps[1:], stamps[:-1], out=keep[1:])
+            if not keep.all():
+                cleaned = cleaned[keep]
+
+        # Downcast to compact dtypes: float32 is ample precision for
+        # tick-size-quantized futures prices and halves cache/compute
+        # bandwidth downstream
+        for col in ('Open', 'High', 'Low', 'Close'):
+            if col in cleaned.columns:
+                cleaned[col] = cleaned[col].astype(np.float32, copy=False)
+        if 'Volume' in cleaned.columns:
+            # int64 rather than int32: index volumes overflow 32 bits
+            cleaned['Volume'] = cleaned['Volume'].astype(np.int64, copy=False)
+
         return cleaned
         
-    def _get_cache_path(
-        self,
-        market: str,
+    @staticmethod
+    def _to_timestamp(value: Union[str, datetime]) -> pd.Timestamp:
+        """Convert to Timestamp, skipping the pandas parser when the
+        value is already a datetime (the common hot-path case)."""
+        if isinstance(value, pd.Timestamp):
+            return value
+        if isinstance(value, datetime):
+            return pd.Timestamp(value)
+        return pd.to_datetime(value, cache=True)
+
+    @staticmethod
+    def _month_keys(
         start_date: Union[str, datetime],
-        end_date: Union[str, datetime],
-        interval: str
-    ) -> Path:
-        """Generate cache file path."""
-        start_str = pd.to_datetime(start_date).strftime('%Y%m%d')
-        end_str = pd.to_datetime(end_date).strftime('%Y%m%d')
-        
-        filename = f"{market}_{start_str}_{end_str}_{interval}.pkl"
+        end_date: Union[str, datetime]
+    ) -> List[str]:
+        """List 'YYYYMM' partition keys covering [start_date, end_date]."""
+        return [
+            f"{p.year}{p.month:02d}"
+            for p in pd.period_range(start_date, end_date, freq='M')
+        ]
+
+    @staticmethod
+    def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+        """Mark a frame's column buffers read-only.
+
+        Mem-cached frames are shared by reference across cache hits; a
+        caller writing into one in place would silently corrupt every
+        subsequent hit. Freezing the underlying ndarrays turns that
+        into an immediate 'read-only' error instead.
+        """
+        for block in df._mgr.blocks:
+            values = block.values
+            if hasattr(values, 'flags'):
+                values.flags.writeable = False
+        return df
+
+    def _get_cache_path(self, market: str, month: str, interval: str) -> Path:
+        """Generate cache file path for one month partition."""
+        ext = 'feather' if pa is not None else 'pkl'
+        filename = f"{market}_{month}_{interval}.{ext}"
         return self.cache_dir / filename
-        
-    def _load_from_cache(
+
+    def _load_partition(
         self,
         market: str,
-        start_date: Union[str, datetime],
-        end_date: Union[str, datetime],
-        interval: str
+        month: str,
+        interval: str,
+        columns: Optional[List[str]] = None
     ) -> Optional[pd.DataFrame]:
-        """Load data from cache if available and fresh."""
-        cache_path = self._get_cache_path(market, start_date, end_date, interval)
-        
+        """Load one month partition from cache if available and fresh.
+
+        When `columns` is given, only those columns (plus the stored
+        index) are read from disk.
+        """
+        cache_path = self._get_cache_path(market, month, interval)
+
         if not cache_path.exists():
             return None
-            
-        # Check cache age
-        cache_age = datetime.now() - datetime.fromtimestamp(
-            cache_path.stat().st_mtime
-        )
-        
-        if cache_age > timedelta(hours=self.cache_expiry_hours):
-            print(f"Cache expired for {market} ({cache_age.total_seconds()/3600:.1f} hours old)")
+
+        # Check cache age with a plain float comparison (no datetime
+        # object churn on the hot path)
+        age_seconds = _time.time() - cache_path.stat().st_mtime
+
+        if age_seconds > self._expiry_seconds:
+            print(f"Cache expired for {market} ({age_seconds/3600:.1f} hours old)")
             return None
-            
+
         try:
-            with open(cache_path, 'rb') as f:
-                data = pickle.load(f)
+            if pa is not None:
+                if columns is not None:
+                    # Column projection: read only the requested columns
+                    # plus the serialized index columns from disk
+                    with pa.memory_map(str(cache_path), 'r') as source:
+                        schema = pa.ipc.open_file(source).schema
+                    # The stored index columns are listed in the schema's
+                    # pandas metadata. A named index (e.g. yfinance's
+                    # Date/Datetime) is serialized under its own name, so
+                    # a __index_level_* prefix match would miss it and the
+                    # projected frame would come back with a RangeIndex.
+                    # Non-string entries describe a RangeIndex and carry
+                    # no column to read.
+                    index_cols: List[str] = []
+                    meta = schema.metadata or {}
+                    if b'pandas' in meta:
+                        index_cols = [
+                            n for n in
+                            json.loads(meta[b'pandas'])['index_columns']
+                            if isinstance(n, str)
+                        ]
+                    cols = list(columns) + index_cols
+                    data = feather.read_table(
+                        cache_path, columns=cols, memory_map=True
+                    ).to_pandas(self_destruct=True)
+                else:
+                    # Memory-map the Arrow IPC file so numeric columns
+                    # come back as zero-copy views instead of a full
+                    # deserialization pass
+                    with pa.memory_map(str(cache_path), 'r') as source:
+                        table = pa.ipc.open_file(source).read_all()
+                    data = table.to_pandas(self_destruct=True)
+            else:
+                with open(cache_path, 'rb') as f:
+                    data = pickle.load(f)
+                if columns is not None:
+                    data = data[list(columns)]
             return data
         except Exception as e:
             print(f"Error loading cache: {e}")
             return None
-            
-    def _save_to_cache(
+
+    def _save_partition(
         self,
         data: pd.DataFrame,
         market: str,
-        start_date: Union[str, datetime],
-        end_date: Union[str, datetime],
+        month: str,
         interval: str
     ):
-        """Save data to cache."""
-        cache_path = self._get_cache_path(market, start_date, end_date, interval)
-        
+        """Save one month partition to cache."""
+        cache_path = self._get_cache_path(market, month, interval)
+
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
+            if pa is not None:
+                feather.write_feather(
+                    pa.Table.from_pandas(data),
+                    cache_path,
+                    compression='lz4'
+                )
+            else:
+                # Protocol 5 serializes the numpy blocks out-of-band
+                # instead of walking them as Python objects
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(data, f, protocol=5)
             print(f"Cached {market} data to {cache_path.name}")
         except Exception as e:
             print(f"Error saving cache: {e}")
+
+    def _load_from_cache(
+        self,
+        market: str,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        interval: str
+    ) -> Optional[pd.DataFrame]:
+        """Load a date range from cache; None unless every month is cached."""
+        pieces = []
+        for month in self._month_keys(start_date, end_date):
+            piece = self._load_partition(market, month, interval)
+            if piece is None:
+                return None
+            pieces.append(piece)
+
+        if not pieces:
+            return None
+
+        combined = pd.concat(pieces)
+        lo = combined.index.searchsorted(self._to_timestamp(start_date), side='left')
+        hi = combined.index.searchsorted(self._to_timestamp(end_date), side='right')
+        return combined.iloc[lo:hi]
+
+    def _save_to_cache(
+        self,
+        data: pd.DataFrame,
+        market: str,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        interval: str
+    ):
+        """Save data to cache, split into month partitions."""
+        for period, group in data.groupby(data.index.to_period('M')):
+            month = f"{period.year}{period.month:02d}"
+            self._save_partition(group, market, month, interval)
             
     def fetch_vix(self, date: datetime) -> float:
         """
@@ -397,21 +808,36 @@ class DataPipelineManager:
         Returns:
             VIX close value
         """
+        cache_key = date.date()
+        if cache_key in self._vix_cache:
+            return self._vix_cache[cache_key]
+
         try:
-            vix = yf.Ticker('^VIX')
+            vix = self._get_ticker('^VIX')
             data = vix.history(
                 start=date - timedelta(days=5),
                 end=date + timedelta(days=1)
             )
-            
+
             if not data.empty:
-                return float(data['Close'].iloc[-1])
+                value = float(data['Close'].iloc[-1])
             else:
-                return 20.0  # Default VIX
-                
+                value = 20.0  # Default VIX
+
         except Exception as e:
             print(f"Error fetching VIX: {e}")
             return 20.0
+
+        self._vix_cache[cache_key] = value
+        return value
+
+    def _get_ticker(self, symbol: str):
+        """Return a memoized yf.Ticker for the given symbol."""
+        ticker = self._ticker_cache.get(symbol)
+        if ticker is None:
+            yf = _lazy_yf()
+            ticker = self._ticker_cache.setdefault(symbol, yf.Ticker(symbol))
+        return ticker
             
     def clear_cache(self, market: Optional[str] = None):
         """
@@ -420,10 +846,11 @@ class DataPipelineManager:
         Args:
             market: Specific market to clear, or None for all
         """
+        ext = 'feather' if pa is not None else 'pkl'
         if market:
-            pattern = f"{market}_*.pkl"
+            pattern = f"{market}_*.{ext}"
         else:
-            pattern = "*.pkl"
+            pattern = f"*.{ext}"
             
         removed = 0
         for cache_file in self.cache_dir.glob(pattern):
@@ -448,16 +875,13 @@ class DataPipelineManager:
             True if market is open
         """
         config = self.markets[market]
-        current_time = timestamp.time()
-        
-        session_start = config['session_start']
-        session_end = config['session_end']
-        
+        minute = timestamp.hour * 60 + timestamp.minute
+
         # Handle overnight sessions
-        if session_end < session_start:
-            return current_time >= session_start or current_time < session_end
+        if config['overnight']:
+            return minute >= config['start_min'] or minute < config['end_min']
         else:
-            return session_start <= current_time < session_end
+            return config['start_min'] <= minute < config['end_min']
 
 
 if __name__ == '__main__':
@@ -468,18 +892,18 @@ if __name__ == '__main__':
     end_date = datetime.now()
     start_date = end_date - timedelta(days=7)
     
-    for market in ['Nikkei', 'DAX', 'Nasdaq']:
+    all_data = pipeline.fetch_historical_data_batch(
+        ['Nikkei', 'DAX', 'Nasdaq'],
+        start_date,
+        end_date,
+        interval='1h'
+    )
+
+    for market, data in all_data.items():
         print(f"\n{'='*60}")
-        print(f"Fetching {market} data...")
+        print(f"{market} data")
         print(f"{'='*60}")
-        
-        data = pipeline.fetch_historical_data(
-            market,
-            start_date,
-            end_date,
-            interval='1h'
-        )
-        
+
         if not data.empty:
             print(f"\nData shape: {data.shape}")
             print(f"Date range: {data.index[0]} to {data.index[-1]}")
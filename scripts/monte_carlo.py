@@ -12,12 +12,68 @@ Performs Monte Carlo simulations to:
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    # Explicit signature so the kernel compiles at import (and hits the
+    # on-disk cache) instead of lazily on the first simulation call
+    @njit(
+        'Tuple((float64[:, ::1], float64[::1]))'
+        '(float64, float64, int64, int64, float64, int64)',
+        parallel=True, cache=True, boundscheck=False
+    )
+    def _simulate_parametric_nb(mean, std, n_simulations, n_days, initial_capital, seed):
+        """Fused parametric simulation: draw returns, build the equity
+        curve, and track the running peak / max drawdown per path in one
+        register-resident loop, parallelized across paths.
+
+        Returns (equity_curves, max_drawdowns).
+        """
+        np.random.seed(seed)
+        curves = np.empty((n_simulations, n_days))
+        max_dd = np.empty(n_simulations)
+        for i in prange(n_simulations):
+            equity = initial_capital
+            # Peak tracks the curve itself (first bar seeds it), matching
+            # the vectorized drawdown definition
+            peak = 0.0
+            worst = 0.0
+            for t in range(n_days):
+                equity *= 1.0 + (mean + std * np.random.standard_normal())
+                if equity > peak:
+                    peak = equity
+                dd = (equity - peak) / peak
+                if dd < worst:
+                    worst = dd
+                curves[i, t] = equity
+            max_dd[i] = worst
+        return curves, max_dd
+else:
+    _simulate_parametric_nb = None
+
+
+def _parametric_chunk(args: tuple) -> np.ndarray:
+    """Worker for the process pool: simulate one chunk of parametric
+    paths with its own independently-seeded Generator."""
+    n_paths, n_days, mean, std, initial_capital, seed_seq = args
+    rng = np.random.default_rng(seed_seq)
+    r = rng.standard_normal(size=(n_paths, n_days), dtype=np.float32)
+    r *= std
+    r += mean
+    np.log1p(r, out=r)
+    np.cumsum(r, axis=1, out=r)
+    return initial_capital * np.exp(r)
+
 
 class MonteCarloSimulator:
     """
@@ -27,22 +83,57 @@ class MonteCarloSimulator:
     return distribution to assess risk and expected outcomes.
     """
     
-    def __init__(self, returns: pd.Series, initial_capital: float = 100000):
+    def __init__(
+        self,
+        returns: pd.Series,
+        initial_capital: float = 100000,
+        seed: Optional[int] = None
+    ):
         """
         Initialize Monte Carlo simulator.
-        
+
         Args:
             returns: Historical daily returns series
             initial_capital: Starting capital for simulations
+            seed: Optional RNG seed for reproducible simulations
         """
         self.returns = returns
         self.initial_capital = initial_capital
-        
-        # Calculate return statistics
-        self.mean_return = returns.mean()
-        self.std_return = returns.std()
-        self.skew = stats.skew(returns)
-        self.kurtosis = stats.kurtosis(returns)
+
+        # SFC64 is considerably faster per sample than the legacy
+        # Mersenne-Twister np.random.* path, and the Generator API lets
+        # us draw float32 directly
+        self.rng = np.random.Generator(np.random.SFC64(seed))
+        self._returns_f32 = np.ascontiguousarray(
+            returns.values, dtype=np.float32
+        )
+
+        # Memo of per-curves results (statistics, drawdowns, confidence
+        # intervals) keyed by array identity, so the typical
+        # run/summarize/plot workflow does each N*T pass once. Each
+        # entry pins the keyed array; see _cache_get.
+        self._cache: Dict[tuple, tuple] = {}
+
+        # Reusable (n_simulations, n_days) float32 scratch buffer for
+        # the return draws, so repeated runs of the same shape skip the
+        # allocation and page-faulting cost
+        self._buf: Optional[np.ndarray] = None
+        
+        # Calculate return statistics from one pass over the central
+        # moments rather than separate pandas/scipy traversals
+        vals = np.asarray(returns, dtype=np.float64)
+        n = vals.size
+        mu = vals.mean()
+        d = vals - mu
+        d2 = d * d
+        m2 = d2.mean()
+        m3 = (d2 * d).mean()
+        m4 = (d2 * d2).mean()
+
+        self.mean_return = mu
+        self.std_return = np.sqrt(m2 * n / (n - 1))
+        self.skew = m3 / m2 ** 1.5
+        self.kurtosis = m4 / (m2 * m2) - 3.0
         
         print(f"MonteCarloSimulator initialized")
         print(f"Historical mean return: {self.mean_return*100:.3f}% daily")
@@ -54,23 +145,48 @@ class MonteCarloSimulator:
         self,
         n_simulations: int = 10000,
         n_days: int = 252,
-        method: str = 'parametric'
+        method: str = 'parametric',
+        n_workers: Optional[int] = None,
+        device: str = 'cpu'
     ) -> np.ndarray:
         """
         Run Monte Carlo simulation.
-        
+
         Args:
             n_simulations: Number of simulation paths
             n_days: Number of trading days to simulate
             method: 'parametric' (normal dist) or 'bootstrap' (resample)
-            
+            n_workers: Optional process count; parametric simulations are
+                split into per-worker chunks (Monte Carlo is
+                embarrassingly parallel)
+            device: 'cpu' or 'cuda' (requires CuPy; falls back to CPU
+                if unavailable)
+
         Returns:
             Array of shape (n_simulations, n_days) with simulated equity curves
         """
         print(f"\nRunning {n_simulations:,} simulations for {n_days} days...")
-        
+
+        self._cache.clear()
+
         if method == 'parametric':
-            simulated_paths = self._parametric_simulation(n_simulations, n_days)
+            simulated_paths = None
+            if device == 'cuda':
+                try:
+                    simulated_paths = self._parametric_simulation_gpu(
+                        n_simulations, n_days
+                    )
+                except ImportError:
+                    print("CuPy not available, falling back to CPU")
+            if simulated_paths is None:
+                if n_workers is not None and n_workers > 1:
+                    simulated_paths = self._parametric_simulation_parallel(
+                        n_simulations, n_days, n_workers
+                    )
+                else:
+                    simulated_paths = self._parametric_simulation(
+                        n_simulations, n_days
+                    )
         elif method == 'bootstrap':
             simulated_paths = self._bootstrap_simulation(n_simulations, n_days)
         else:
@@ -89,21 +205,106 @@ class MonteCarloSimulator:
         
         Assumes returns follow normal distribution with historical mean/std.
         """
-        # Generate random returns from normal distribution
-        simulated_returns = np.random.normal(
-            self.mean_return,
-            self.std_return,
-            size=(n_simulations, n_days)
-        )
-        
-        # Convert returns to equity curves
-        equity_curves = self.initial_capital * np.cumprod(
-            1 + simulated_returns,
-            axis=1
+        if _simulate_parametric_nb is not None:
+            # Fused JIT kernel: simulation and max drawdown in one pass
+            seed = int(self.rng.integers(0, 2**31 - 1))
+            equity_curves, max_dd = _simulate_parametric_nb(
+                self.mean_return,
+                self.std_return,
+                n_simulations,
+                n_days,
+                self.initial_capital,
+                seed
+            )
+            self._cache_put('drawdowns', equity_curves, max_dd)
+            return equity_curves
+
+        # Generate random returns from normal distribution, drawn
+        # directly in float32 to halve RNG and cumprod bandwidth, into
+        # the reusable scratch buffer
+        simulated_returns = self._get_buf((n_simulations, n_days))
+        self.rng.standard_normal(
+            dtype=np.float32, out=simulated_returns
         )
-        
+        simulated_returns *= self.std_return
+        simulated_returns += self.mean_return
+
+        # Convert returns to equity curves via log-space accumulation:
+        # log1p + cumsum + exp vectorizes better than a serial multiply
+        # chain and is numerically stabler over long horizons
+        np.log1p(simulated_returns, out=simulated_returns)
+        np.cumsum(simulated_returns, axis=1, out=simulated_returns)
+        log_curves = simulated_returns.copy()
+        equity_curves = self.initial_capital * np.exp(simulated_returns)
+
+        # Stash the log-equity curves so the drawdown pass can work in
+        # log space (subtraction instead of division against the peak)
+        self._cache_put('log_curves', equity_curves, log_curves)
+
         return equity_curves
-        
+
+    def _parametric_simulation_parallel(
+        self,
+        n_simulations: int,
+        n_days: int,
+        n_workers: int
+    ) -> np.ndarray:
+        """
+        Parametric simulation split across a process pool.
+
+        Each worker gets an independent child of one SeedSequence so the
+        per-process streams never overlap.
+        """
+        seed_seq = np.random.SeedSequence(int(self.rng.integers(0, 2**63)))
+        children = seed_seq.spawn(n_workers)
+
+        base = n_simulations // n_workers
+        counts = [base] * n_workers
+        counts[-1] += n_simulations - base * n_workers
+
+        jobs = [
+            (counts[i], n_days, self.mean_return, self.std_return,
+             self.initial_capital, children[i])
+            for i in range(n_workers)
+        ]
+
+        # Spawned (not forked) workers: numba's threading layer is not
+        # fork-safe, and the eagerly compiled parallel kernel in this
+        # module makes a forked pool hang the interpreter at shutdown
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context('spawn')
+        ) as pool:
+            parts = list(pool.map(_parametric_chunk, jobs))
+
+        return np.concatenate(parts, axis=0)
+
+    def _parametric_simulation_gpu(
+        self,
+        n_simulations: int,
+        n_days: int
+    ) -> np.ndarray:
+        """
+        Parametric simulation on the GPU via CuPy.
+
+        Same float32 draw + log-space accumulation as the CPU path;
+        only the final curves cross back over PCIe.
+        """
+        import cupy as cp
+
+        rng = cp.random.default_rng(int(self.rng.integers(0, 2**63)))
+        simulated_returns = rng.standard_normal(
+            size=(n_simulations, n_days), dtype=cp.float32
+        )
+        simulated_returns *= self.std_return
+        simulated_returns += self.mean_return
+
+        cp.log1p(simulated_returns, out=simulated_returns)
+        simulated_returns = cp.cumsum(simulated_returns, axis=1)
+        equity_curves = self.initial_capital * cp.exp(simulated_returns)
+
+        return cp.asnumpy(equity_curves)
+
     def _bootstrap_simulation(
         self,
         n_simulations: int,
@@ -114,21 +315,79 @@ class MonteCarloSimulator:
         
         Preserves actual return distribution including fat tails.
         """
-        # Resample from historical returns
-        simulated_returns = np.random.choice(
-            self.returns.values,
-            size=(n_simulations, n_days),
-            replace=True
-        )
-        
-        # Convert returns to equity curves
-        equity_curves = self.initial_capital * np.cumprod(
-            1 + simulated_returns,
-            axis=1
-        )
-        
+        # Resample from historical returns via integer indexing into a
+        # contiguous float32 copy (faster than np.random.choice). For
+        # large draws, split across threads — Generator releases the GIL
+        # during the integer draw — each seeded from its own
+        # SeedSequence child.
+        vals = self._returns_f32
+        n_vals = len(vals)
+        n_threads = min(os.cpu_count() or 1, 8)
+
+        if n_simulations >= 1024 and n_threads > 1:
+            seed_seq = np.random.SeedSequence(
+                int(self.rng.integers(0, 2**63))
+            )
+            children = seed_seq.spawn(n_threads)
+            bounds = np.linspace(0, n_simulations, n_threads + 1).astype(int)
+            simulated_returns = self._get_buf((n_simulations, n_days))
+
+            def fill(i: int):
+                rng = np.random.default_rng(children[i])
+                lo, hi = bounds[i], bounds[i + 1]
+                simulated_returns[lo:hi] = vals[
+                    rng.integers(0, n_vals, size=(hi - lo, n_days))
+                ]
+
+            with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                list(pool.map(fill, range(n_threads)))
+        else:
+            indices = self.rng.integers(
+                0, n_vals, size=(n_simulations, n_days)
+            )
+            simulated_returns = vals[indices]
+
+        # Convert returns to equity curves via log-space accumulation
+        np.log1p(simulated_returns, out=simulated_returns)
+        np.cumsum(simulated_returns, axis=1, out=simulated_returns)
+        log_curves = simulated_returns.copy()
+        equity_curves = self.initial_capital * np.exp(simulated_returns)
+
+        self._cache_put('log_curves', equity_curves, log_curves)
+
         return equity_curves
         
+    def _get_buf(self, shape: tuple) -> np.ndarray:
+        """Return the reusable float32 scratch buffer, reallocating only
+        when the requested shape changes."""
+        if self._buf is None or self._buf.shape != shape:
+            self._buf = np.empty(shape, dtype=np.float32)
+        return self._buf
+
+    @staticmethod
+    def _cache_key(name: str, equity_curves: np.ndarray) -> tuple:
+        """Memo key tied to the identity of a curves array."""
+        return (name, id(equity_curves), equity_curves.shape,
+                str(equity_curves.dtype))
+
+    def _cache_get(self, name: str, equity_curves: np.ndarray):
+        """Return the memoized value for this exact array, or None.
+
+        id() values are recycled once an array is garbage collected, so
+        a bare id-keyed hit could hand one array another array's
+        results. Entries therefore pin the keyed array and the lookup
+        re-checks identity against it.
+        """
+        entry = self._cache.get(self._cache_key(name, equity_curves))
+        if entry is not None and entry[0] is equity_curves:
+            return entry[1]
+        return None
+
+    def _cache_put(self, name: str, equity_curves: np.ndarray, value):
+        """Memoize value for this array, holding a reference to it."""
+        key = self._cache_key(name, equity_curves)
+        self._cache[key] = (equity_curves, value)
+
     def calculate_statistics(
         self,
         equity_curves: np.ndarray
@@ -142,9 +401,28 @@ class MonteCarloSimulator:
         Returns:
             Dictionary of statistical measures
         """
-        final_values = equity_curves[:, -1]
+        cached = self._cache_get('statistics', equity_curves)
+        if cached is not None:
+            return cached
+
+        # The last column of a C-order (N, T) array is strided; make it
+        # contiguous once so every reduction below streams linearly
+        final_values = np.ascontiguousarray(equity_curves[:, -1])
         returns = (final_values / self.initial_capital) - 1
-        
+
+        # One np.partition at both tail pivots serves VaR and CVaR: the
+        # pivots are the order statistics themselves, and the k smallest
+        # returns sit contiguously at the front for the tail means
+        n = len(returns)
+        k01 = max(1, int(0.01 * n))
+        k05 = max(1, int(0.05 * n))
+        tail = np.partition(returns, (k01, k05))
+
+        # The 1% tail is a prefix of the 5% tail, so its sum is reused
+        # rather than re-reduced
+        sum01 = tail[:k01].sum()
+        sum05 = sum01 + tail[k01:k05].sum()
+
         stats_dict = {
             'mean_final_value': final_values.mean(),
             'median_final_value': np.median(final_values),
@@ -154,45 +432,57 @@ class MonteCarloSimulator:
             'std_return': returns.std(),
             'min_return': returns.min(),
             'max_return': returns.max(),
-            'prob_profit': (returns > 0).mean(),
-            'prob_loss': (returns < 0).mean(),
-            'var_95': np.percentile(returns, 5),
-            'var_99': np.percentile(returns, 1),
-            'cvar_95': returns[returns <= np.percentile(returns, 5)].mean(),
-            'cvar_99': returns[returns <= np.percentile(returns, 1)].mean()
+            'prob_profit': np.count_nonzero(returns > 0) / n,
+            'prob_loss': np.count_nonzero(returns < 0) / n,
+            'var_95': tail[k05],
+            'var_99': tail[k01],
+            'cvar_95': sum05 / k05,
+            'cvar_99': sum01 / k01
         }
-        
+
+        self._cache_put('statistics', equity_curves, stats_dict)
         return stats_dict
         
     def calculate_confidence_intervals(
         self,
         equity_curves: np.ndarray,
         confidence_levels: List[float] = [0.05, 0.25, 0.50, 0.75, 0.95]
-    ) -> pd.DataFrame:
+    ) -> Dict[str, np.ndarray]:
         """
         Calculate confidence intervals for equity curves.
-        
+
         Args:
             equity_curves: Simulated paths
             confidence_levels: Percentiles to calculate
-            
+
         Returns:
-            DataFrame with confidence intervals over time
+            Dict mapping 'p<level>' to a per-day array of values
         """
-        n_days = equity_curves.shape[1]
-        
-        percentiles = {}
-        for conf in confidence_levels:
-            percentiles[f'p{int(conf*100)}'] = np.percentile(
-                equity_curves,
-                conf * 100,
-                axis=0
-            )
-            
-        df = pd.DataFrame(percentiles)
-        df['day'] = range(n_days)
-        
-        return df
+        name = f"confidence_{tuple(confidence_levels)}"
+        cached = self._cache_get(name, equity_curves)
+        if cached is not None:
+            return cached
+
+        # All requested levels in one batched quantile pass over a
+        # throwaway float32 C-order copy: half the memory traffic for
+        # the in-place partition, and overwrite_input spares NumPy a
+        # second internal copy. Keeping the result as plain arrays
+        # avoids DataFrame construction on the hot path.
+        scratch = np.array(equity_curves, dtype=np.float32, order='C')
+        pcts = np.quantile(
+            scratch,
+            confidence_levels,
+            axis=0,
+            overwrite_input=True
+        )
+
+        percentiles = {
+            f'p{int(conf*100)}': pcts[i]
+            for i, conf in enumerate(confidence_levels)
+        }
+
+        self._cache_put(name, equity_curves, percentiles)
+        return percentiles
         
     def calculate_drawdown_distribution(
         self,
@@ -207,15 +497,32 @@ class MonteCarloSimulator:
         Returns:
             Array of maximum drawdown for each path
         """
-        max_drawdowns = []
-        
-        for path in equity_curves:
-            peak = np.maximum.accumulate(path)
-            drawdown = (path - peak) / peak
-            max_dd = drawdown.min()
-            max_drawdowns.append(max_dd)
-            
-        return np.array(max_drawdowns)
+        cached = self._cache_get('drawdowns', equity_curves)
+        if cached is not None:
+            return cached
+
+        # If the simulation stashed log-equity curves, work in log
+        # space: drawdown against the peak is a subtraction there, and
+        # only the per-path minimum goes through expm1
+        log_curves = self._cache_get('log_curves', equity_curves)
+        if log_curves is not None:
+            peak = np.maximum.accumulate(log_curves, axis=1)
+            np.subtract(log_curves, peak, out=peak)
+            max_drawdowns = np.expm1(peak.min(axis=1))
+            self._cache_put('drawdowns', equity_curves, max_drawdowns)
+            return max_drawdowns
+
+        # One vectorized pass over the whole (N, T) array instead of a
+        # Python loop with per-path ufunc dispatch. (P - peak) / peak is
+        # computed as P / peak - 1 so the peak buffer can be reused
+        # in place.
+        peak = np.maximum.accumulate(equity_curves, axis=1)
+        np.divide(equity_curves, peak, out=peak)
+        peak -= 1.0
+        max_drawdowns = peak.min(axis=1)
+
+        self._cache_put('drawdowns', equity_curves, max_drawdowns)
+        return max_drawdowns
         
     def stress_test(
         self,
@@ -235,33 +542,42 @@ class MonteCarloSimulator:
             Results for each scenario
         """
         results = {}
-        
-        for scenario_name, params in scenarios.items():
-            print(f"\nRunning stress test: {scenario_name}")
-            
-            # Generate returns with scenario parameters
-            simulated_returns = np.random.normal(
-                params['mean'],
-                params['std'],
-                size=(n_simulations, n_days)
-            )
-            
-            # Convert to equity curves
-            equity_curves = self.initial_capital * np.cumprod(
-                1 + simulated_returns,
-                axis=1
-            )
-            
+        names = list(scenarios.keys())
+        print(f"\nRunning {len(names)} stress scenarios...")
+
+        # Broadcast per-scenario mean/std over one (S, N, T) draw so all
+        # scenarios are generated and compounded in a single tensor pass
+        # instead of S separate RNG + cumprod calls
+        means = np.array(
+            [scenarios[name]['mean'] for name in names], dtype=np.float32
+        )
+        stds = np.array(
+            [scenarios[name]['std'] for name in names], dtype=np.float32
+        )
+
+        z = self.rng.standard_normal(
+            (len(names), n_simulations, n_days), dtype=np.float32
+        )
+        simulated_returns = means[:, None, None] + stds[:, None, None] * z
+
+        # Log-space accumulation (see _parametric_simulation)
+        np.log1p(simulated_returns, out=simulated_returns)
+        np.cumsum(simulated_returns, axis=2, out=simulated_returns)
+        all_curves = self.initial_capital * np.exp(simulated_returns)
+
+        for i, scenario_name in enumerate(names):
+            equity_curves = all_curves[i]
+
             # Calculate statistics
             stats = self.calculate_statistics(equity_curves)
-            
+
             # Calculate max drawdowns
             max_dds = self.calculate_drawdown_distribution(equity_curves)
             stats['mean_max_drawdown'] = max_dds.mean()
             stats['worst_drawdown'] = max_dds.min()
-            
+
             results[scenario_name] = stats
-            
+
         return results
         
     def plot_simulation_results(
@@ -278,19 +594,32 @@ class MonteCarloSimulator:
             n_paths_to_plot: Number of individual paths to show
             save_path: Optional path to save figure
         """
+        # Matplotlib is imported lazily so simulation-only callers never
+        # pay its import cost
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         
-        # Plot 1: Sample paths
+        # Plot 1: Sample paths — a single LineCollection instead of one
+        # Line2D artist per path keeps rendering fast for many curves
         ax1 = axes[0, 0]
         sample_indices = np.random.choice(
             len(equity_curves),
             min(n_paths_to_plot, len(equity_curves)),
             replace=False
         )
-        
-        for idx in sample_indices:
-            ax1.plot(equity_curves[idx], alpha=0.1, color='blue', linewidth=0.5)
-            
+
+        days = np.arange(equity_curves.shape[1])
+        segments = [
+            np.column_stack([days, equity_curves[idx]])
+            for idx in sample_indices
+        ]
+        ax1.add_collection(LineCollection(
+            segments, colors='blue', alpha=0.1, linewidths=0.5
+        ))
+        ax1.autoscale_view()
+
         # Add percentiles
         conf_intervals = self.calculate_confidence_intervals(equity_curves)
         ax1.plot(conf_intervals['p50'], 'r-', linewidth=2, label='Median')
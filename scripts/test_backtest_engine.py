@@ -3,6 +3,7 @@ Unit Tests for Backtest Engine
 Comprehensive test suite for backtesting functionality
 """
 
+import copy
 import pytest
 import pandas as pd
 import numpy as np
@@ -14,19 +15,40 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+@pytest.fixture(scope='session')
+def engine_cls():
+    """Resolve the BacktestEngine import once for the whole session
+    instead of re-importing inside every test body."""
+    from backtest_engine import BacktestEngine
+    return BacktestEngine
+
+
+@pytest.fixture(scope='session')
+def base_engine(engine_cls):
+    """One canonical engine shared across tests. Construction (market
+    configs, VIX setup) is paid once; tests that mutate state deepcopy
+    it first."""
+    return engine_cls(
+        start_date='2024-01-01',
+        end_date='2024-12-31',
+        initial_capital=100000
+    )
+
+
 class TestBacktestEngine:
     """Test suite for BacktestEngine class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope='session')
     def sample_data(self):
-        """Generate sample market data for testing."""
+        """Generate sample market data once per test session."""
+        rng = np.random.default_rng(42)
         dates = pd.date_range('2024-01-01', periods=100, freq='1h')
         data = pd.DataFrame({
-            'Open': 100 + np.random.randn(100).cumsum(),
-            'High': 101 + np.random.randn(100).cumsum(),
-            'Low': 99 + np.random.randn(100).cumsum(),
-            'Close': 100 + np.random.randn(100).cumsum(),
-            'Volume': np.random.randint(1000, 10000, 100)
+            'Open': 100 + rng.standard_normal(100).cumsum(),
+            'High': 101 + rng.standard_normal(100).cumsum(),
+            'Low': 99 + rng.standard_normal(100).cumsum(),
+            'Close': 100 + rng.standard_normal(100).cumsum(),
+            'Volume': rng.integers(1000, 10000, 100)
         }, index=dates)
         
         # Ensure OHLC relationships
@@ -35,46 +57,29 @@ class TestBacktestEngine:
         
         return data
     
-    def test_initialization(self):
+    def test_initialization(self, base_engine):
         """Test engine initialization."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
-            start_date='2024-01-01',
-            end_date='2024-12-31',
-            initial_capital=100000
-        )
-        
-        assert engine.initial_capital == 100000
-        assert engine.capital == 100000
-        assert len(engine.trades) == 0
-        
-    def test_position_sizing(self):
+        assert base_engine.initial_capital == 100000
+        assert base_engine.capital == 100000
+        assert len(base_engine.trades) == 0
+
+    def test_position_sizing(self, base_engine):
         """Test VIX-adaptive position sizing."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
-            start_date='2024-01-01',
-            end_date='2024-12-31'
-        )
-        
         # Test low VIX
-        size_low = engine.calculate_position_size(vix_level=12, market='Nikkei')
+        size_low = base_engine.calculate_position_size(vix_level=12, market='Nikkei')
         assert size_low == 100000 * 0.95  # Full size
-        
+
         # Test medium VIX
-        size_med = engine.calculate_position_size(vix_level=20, market='DAX')
+        size_med = base_engine.calculate_position_size(vix_level=20, market='DAX')
         assert size_med == 100000 * 0.95 * 0.75  # Reduced size
-        
+
         # Test high VIX
-        size_high = engine.calculate_position_size(vix_level=40, market='Nasdaq')
+        size_high = base_engine.calculate_position_size(vix_level=40, market='Nasdaq')
         assert size_high == 100000 * 0.95 * 0.30  # Minimal size
-        
-    def test_session_execution(self, sample_data):
+
+    def test_session_execution(self, engine_cls, sample_data):
         """Test single session execution."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
+        engine = engine_cls(
             start_date='2024-01-01',
             end_date='2024-01-02'
         )
@@ -89,11 +94,10 @@ class TestBacktestEngine:
         assert 'return' in result
         assert 'pnl' in result
         
-    def test_backtest_execution(self):
+    @pytest.mark.slow
+    def test_backtest_execution(self, engine_cls):
         """Test complete backtest run."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
+        engine = engine_cls(
             start_date='2024-01-01',
             end_date='2024-01-10',
             initial_capital=100000
@@ -106,16 +110,13 @@ class TestBacktestEngine:
         assert 'market' in results.columns
         assert 'pnl' in results.columns
         
-    def test_metrics_calculation(self):
+    @pytest.mark.slow
+    def test_metrics_calculation(self, base_engine):
         """Test performance metrics calculation."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
-            start_date='2024-01-01',
-            end_date='2024-12-31',
-            initial_capital=100000
-        )
-        
+        # run_backtest mutates engine state, so work on a copy of the
+        # shared engine
+        engine = copy.deepcopy(base_engine)
+
         # Run backtest
         engine.run_backtest()
         
@@ -128,11 +129,10 @@ class TestBacktestEngine:
         assert 'Max Drawdown' in metrics
         assert 'Win Rate' in metrics
         
-    def test_commission_calculation(self):
+    @pytest.mark.slow
+    def test_commission_calculation(self, engine_cls):
         """Test commission and slippage application."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
+        engine = engine_cls(
             start_date='2024-01-01',
             end_date='2024-01-10',
             commission_rate=0.001,  # 10 bps
@@ -145,47 +145,32 @@ class TestBacktestEngine:
         assert engine.commission_rate == 0.001
         assert engine.slippage_bps == 2
         
-    def test_market_config(self):
+    def test_market_config(self, base_engine):
         """Test market configuration."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
-            start_date='2024-01-01',
-            end_date='2024-01-10'
-        )
-        
         # Verify market configs exist
-        assert 'Nikkei' in engine.market_config
-        assert 'DAX' in engine.market_config
-        assert 'Nasdaq' in engine.market_config
-        
+        assert 'Nikkei' in base_engine.market_config
+        assert 'DAX' in base_engine.market_config
+        assert 'Nasdaq' in base_engine.market_config
+
         # Verify config structure
-        nikkei_config = engine.market_config['Nikkei']
+        nikkei_config = base_engine.market_config['Nikkei']
         assert 'ticker' in nikkei_config
         assert 'session_start' in nikkei_config
         assert 'session_end' in nikkei_config
         
-    def test_vix_fetch(self):
+    @pytest.mark.slow
+    def test_vix_fetch(self, base_engine):
         """Test VIX data fetching."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
-            start_date='2024-01-01',
-            end_date='2024-01-10'
-        )
-        
-        vix = engine.fetch_vix(datetime(2024, 1, 5))
+        vix = base_engine.fetch_vix(datetime(2024, 1, 5))
         
         assert isinstance(vix, float)
         assert vix > 0
         assert vix < 100  # Reasonable VIX range
         
-    def test_export_results(self):
+    @pytest.mark.slow
+    def test_export_results(self, engine_cls):
         """Test results export to CSV."""
-        import os
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
+        engine = engine_cls(
             start_date='2024-01-01',
             end_date='2024-01-10'
         )
@@ -211,23 +196,19 @@ class TestBacktestEngine:
 class TestBacktestEdgeCases:
     """Test edge cases and error handling."""
     
-    def test_zero_capital(self):
+    def test_zero_capital(self, engine_cls):
         """Test handling of zero capital."""
-        from backtest_engine import BacktestEngine
-        
         with pytest.raises(ValueError):
-            engine = BacktestEngine(
+            engine = engine_cls(
                 start_date='2024-01-01',
                 end_date='2024-01-10',
                 initial_capital=0
             )
     
-    def test_invalid_dates(self):
+    def test_invalid_dates(self, engine_cls):
         """Test invalid date ranges."""
-        from backtest_engine import BacktestEngine
-        
         # End before start
-        engine = BacktestEngine(
+        engine = engine_cls(
             start_date='2024-12-31',
             end_date='2024-01-01'
         )
@@ -235,11 +216,9 @@ class TestBacktestEdgeCases:
         results = engine.run_backtest()
         assert len(results) == 0
         
-    def test_missing_data(self):
+    def test_missing_data(self, engine_cls):
         """Test handling of missing market data."""
-        from backtest_engine import BacktestEngine
-        
-        engine = BacktestEngine(
+        engine = engine_cls(
             start_date='2024-01-01',
             end_date='2024-01-10'
         )
@@ -11,13 +11,212 @@ Implements walk-forward analysis to:
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Callable
+import hashlib
 import itertools
+import logging
 from concurrent.futures import ProcessPoolExecutor, as_completed
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+try:
+    import optuna
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+except ImportError:
+    optuna = None
+
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+
+def _move_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Rolling mean with NaN warmup (pandas rolling().mean() layout)."""
+    if bn is not None:
+        return bn.move_mean(values, window)
+    cs = np.cumsum(values)
+    out = np.full(values.size, np.nan)
+    out[window - 1:] = (
+        cs[window - 1:] - np.concatenate(([0.0], cs[:-window]))
+    ) / window
+    return out
+
+
+def _grid_eval_py(close, fast_mas, slow_mas, metric_code):
+    """Score every MA crossover in the grid in one pass over close.
+
+    For each combination the two moving averages are maintained as
+    running sums and the strategy-return statistics accumulated
+    in-place, so no per-combination arrays are allocated. Matches
+    example_strategy_function exactly (warmup signal -1, std ddof=1,
+    log-space compounding). metric_code: 0=sharpe, 1=total_return,
+    2=cagr.
+    """
+    n = close.shape[0]
+    n_combos = fast_mas.shape[0]
+    scores = np.empty(n_combos)
+    for i in prange(n_combos):
+        fw = fast_mas[i]
+        sw = slow_mas[i]
+        fast_sum = 0.0
+        slow_sum = 0.0
+        prev_sig = -1.0
+        sum_r = 0.0
+        sumsq_r = 0.0
+        log_acc = 0.0
+        for t in range(n):
+            if t >= 1:
+                r = close[t] / close[t - 1] - 1.0
+                sr = prev_sig * r
+                sum_r += sr
+                sumsq_r += sr * sr
+                log_acc += np.log1p(sr)
+            fast_sum += close[t]
+            if t >= fw:
+                fast_sum -= close[t - fw]
+            slow_sum += close[t]
+            if t >= sw:
+                slow_sum -= close[t - sw]
+            if t + 1 >= fw and t + 1 >= sw \
+                    and fast_sum / fw > slow_sum / sw:
+                prev_sig = 1.0
+            else:
+                prev_sig = -1.0
+        nr = n - 1
+        if metric_code == 0:
+            mean_r = sum_r / nr
+            var_r = (sumsq_r - nr * mean_r * mean_r) / (nr - 1)
+            scores[i] = mean_r / np.sqrt(var_r) * np.sqrt(252.0)
+        else:
+            total_return = np.expm1(log_acc)
+            if metric_code == 1:
+                scores[i] = total_return
+            else:
+                scores[i] = (1.0 + total_return) ** (252.0 / n) - 1.0
+    return scores
+
+
+if njit is not None:
+    _grid_eval = njit(parallel=True, cache=True)(_grid_eval_py)
+else:
+    _grid_eval = _grid_eval_py
+
+
+# Metric extractors, resolved once per optimizer instead of walking a
+# string if/elif chain on every evaluation
+_METRIC_FNS: Dict[str, Callable[[Dict], float]] = {
+    'sharpe': lambda r: r.get('sharpe_ratio', -np.inf),
+    'cagr': lambda r: r.get('cagr', -np.inf),
+    'calmar': lambda r: r.get('calmar_ratio', -np.inf),
+    'profit_factor': lambda r: r.get('profit_factor', 0),
+}
+
+
+def _default_metric_fn(results: Dict) -> float:
+    return results.get('total_return', -np.inf)
+
+
+def _metric_value(results: Dict, metric: str) -> float:
+    """Extract the optimization metric from strategy results."""
+    return _METRIC_FNS.get(metric, _default_metric_fn)(results)
+
+
+def _eval_params(args: tuple) -> Tuple[Dict, float]:
+    """Evaluate one parameter combination (module-level so it pickles
+    cleanly into worker processes)."""
+    strategy_func, data_window, params, metric = args
+    results = strategy_func(data_window, **params)
+    return params, _metric_value(results, metric)
+
+
+_METRIC_CODES = {'sharpe': 0, 'total_return': 1, 'cagr': 2}
+
+
+def _fast_grid_scores(
+    strategy_func: Callable,
+    data_window: pd.DataFrame,
+    param_grid: List[Dict],
+    metric: str
+) -> Optional[np.ndarray]:
+    """Score the whole grid with the compiled kernel when possible.
+
+    Only applies to the stock example_strategy_function with a pure
+    (fast_ma, slow_ma) grid and a metric the kernel computes; returns
+    None otherwise so callers fall back to per-combination evaluation.
+    """
+    if njit is None or strategy_func is not example_strategy_function:
+        return None
+    code = _METRIC_CODES.get(metric)
+    if code is None or 'Close' not in data_window.columns:
+        return None
+    if any(set(p) != {'fast_ma', 'slow_ma'} for p in param_grid):
+        return None
+
+    fast_mas = np.array([p['fast_ma'] for p in param_grid], dtype=np.int64)
+    slow_mas = np.array([p['slow_ma'] for p in param_grid], dtype=np.int64)
+    close = np.ascontiguousarray(
+        data_window['Close'].to_numpy(dtype=np.float64)
+    )
+    return _grid_eval(close, fast_mas, slow_mas, code)
+
+
+def _process_window(
+    strategy_func: Callable,
+    in_sample_data: pd.DataFrame,
+    out_sample_data: pd.DataFrame,
+    start_date: datetime,
+    window_num: int,
+    param_grid: List[Dict],
+    metric: str
+) -> Dict:
+    """Optimize one window and evaluate out-of-sample (module-level so
+    joblib can dispatch whole windows to worker processes)."""
+    scores = _fast_grid_scores(strategy_func, in_sample_data,
+                               param_grid, metric)
+    if scores is None:
+        scores = np.array([
+            _metric_value(strategy_func(in_sample_data, **params), metric)
+            for params in param_grid
+        ])
+    best_idx = int(np.argmax(scores))
+    best_params = param_grid[best_idx]
+    in_sample_score = float(scores[best_idx])
+
+    out_sample_results = strategy_func(out_sample_data, **best_params)
+    out_sample_score = _metric_value(out_sample_results, metric)
+
+    return {
+        'window': window_num,
+        'start_date': start_date,
+        'end_date': out_sample_data.index[-1],
+        'in_sample_score': in_sample_score,
+        'out_sample_score': out_sample_score,
+        'degradation': in_sample_score - out_sample_score,
+        **{f'param_{k}': v for k, v in best_params.items()},
+        **{f'out_{k}': v for k, v in out_sample_results.items()}
+    }
+
 
 class WalkForwardOptimizer:
     """
@@ -36,11 +235,12 @@ class WalkForwardOptimizer:
         in_sample_days: int = 252,
         out_sample_days: int = 63,
         step_days: int = 21,
-        optimization_metric: str = 'sharpe'
+        optimization_metric: str = 'sharpe',
+        optimize_method: str = 'grid'
     ):
         """
         Initialize walk-forward optimizer.
-        
+
         Args:
             strategy_func: Function that runs strategy with given parameters
             data: Historical market data
@@ -48,6 +248,8 @@ class WalkForwardOptimizer:
             out_sample_days: Days for validation
             step_days: Days to roll forward each iteration
             optimization_metric: Metric to optimize ('sharpe', 'cagr', 'calmar')
+            optimize_method: 'grid' (exhaustive) or 'tpe' (Optuna
+                model-based search over a fraction of the grid)
         """
         self.strategy_func = strategy_func
         self.data = data
@@ -55,16 +257,39 @@ class WalkForwardOptimizer:
         self.out_sample_days = out_sample_days
         self.step_days = step_days
         self.optimization_metric = optimization_metric
-        
+        self._metric_fn = _METRIC_FNS.get(
+            optimization_metric, _default_metric_fn
+        )
+
+        if optimize_method == 'tpe' and optuna is None:
+            print("optuna not installed - falling back to grid search")
+            optimize_method = 'grid'
+        self.optimize_method = optimize_method
+
         # Results storage
         self.optimization_results = []
         self.out_sample_results = []
+
+        # Memo of (window hash, params) -> score. Consecutive windows
+        # overlap by ~(in_sample - step) days, and re-running the
+        # optimizer revisits identical (window, params) pairs, so the
+        # cache skips whole strategy evaluations.
+        self._eval_cache: OrderedDict = OrderedDict()
+        self._eval_cache_size = 4096
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Memoized window boundaries (integer index pairs, not
+        # materialized frames)
+        self._windows: Optional[List[Tuple[int, int, int, datetime]]] = None
+        self._windows_key: Optional[tuple] = None
         
         print(f"WalkForwardOptimizer initialized")
         print(f"In-sample period: {in_sample_days} days")
         print(f"Out-of-sample period: {out_sample_days} days")
         print(f"Step size: {step_days} days")
         print(f"Optimization metric: {optimization_metric}")
+        print(f"Optimization method: {self.optimize_method}")
         
     def create_parameter_grid(
         self,
@@ -97,46 +322,212 @@ class WalkForwardOptimizer:
     def optimize_window(
         self,
         data_window: pd.DataFrame,
-        param_grid: List[Dict]
+        param_grid: List[Dict],
+        n_workers: Optional[int] = None
     ) -> Tuple[Dict, float]:
         """
         Optimize parameters for a single window.
-        
+
         Args:
             data_window: Data for this optimization window
             param_grid: Parameter combinations to test
-            
+            n_workers: Optional process count; the grid is evaluated in
+                parallel (each combination is independent)
+
         Returns:
             Tuple of (best_params, best_score)
         """
         best_params = None
         best_score = -np.inf
-        
+
+        # Compiled fast path: for the stock MA-crossover strategy the
+        # whole grid collapses into one njit(parallel=True) kernel call
+        fast_scores = self._grid_eval_fast(data_window, param_grid)
+        if fast_scores is not None:
+            window_key = self._window_key(data_window)
+            for params, score in zip(param_grid, fast_scores):
+                key = (window_key, tuple(sorted(params.items())))
+                self._cache_store(key, float(score))
+                if score > best_score:
+                    best_score = float(score)
+                    best_params = params
+            return best_params, best_score
+
+        # Precompute every candidate MA once per window: a 4x4 grid
+        # otherwise recomputes the same rolling means 16 times over the
+        # same close array. Only the stock strategy is known to accept
+        # the precomputed_mas kwarg; injecting it into an arbitrary
+        # strategy with a fixed signature would raise TypeError.
+        precomputed = None
+        if self.strategy_func is example_strategy_function:
+            precomputed = self._precompute_mas(data_window, param_grid)
+
+        # Split the grid into cached scores and combinations that still
+        # need a real evaluation
+        window_key = self._window_key(data_window)
+        pending = []
         for params in param_grid:
+            key = (window_key, tuple(sorted(params.items())))
+            score = self._eval_cache.get(key)
+            if score is not None:
+                self.cache_hits += 1
+                self._eval_cache.move_to_end(key)
+                if score > best_score:
+                    best_score = score
+                    best_params = params
+            else:
+                self.cache_misses += 1
+                pending.append((key, params))
+
+        if n_workers is not None and n_workers > 1 and len(pending) > 1:
+            # Fan the remaining grid out across processes; chunking
+            # amortizes the per-task pickling cost over several
+            # evaluations
+            jobs = [
+                (self.strategy_func, data_window,
+                 dict(params, precomputed_mas=precomputed)
+                 if precomputed else params,
+                 self.optimization_metric)
+                for _, params in pending
+            ]
+            chunksize = max(1, len(pending) // (n_workers * 4))
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                scores = list(executor.map(
+                    _eval_params, jobs, chunksize=chunksize
+                ))
+            for (key, params), (_, score) in zip(pending, scores):
+                self._cache_store(key, score)
+                if score > best_score:
+                    best_score = score
+                    best_params = params
+            return best_params, best_score
+
+        for key, params in pending:
             # Run strategy with these parameters
-            results = self.strategy_func(data_window, **params)
-            
+            if precomputed:
+                results = self.strategy_func(
+                    data_window, precomputed_mas=precomputed, **params
+                )
+            else:
+                results = self.strategy_func(data_window, **params)
+
             # Calculate optimization metric
             score = self._calculate_metric(results)
-            
+            self._cache_store(key, score)
+
             if score > best_score:
                 best_score = score
                 best_params = params
-                
+
         return best_params, best_score
-        
+
+    def optimize_window_tpe(
+        self,
+        data_window: pd.DataFrame,
+        param_ranges: Dict[str, List],
+        n_trials: Optional[int] = None,
+        n_workers: Optional[int] = None
+    ) -> Tuple[Dict, float]:
+        """
+        Optimize a single window with Optuna's TPE sampler.
+
+        Instead of scanning the full grid, the sampler models which
+        regions of the parameter space score well and concentrates
+        trials there, so only a fraction of the combinations need a
+        real strategy evaluation.
+
+        Args:
+            data_window: Data for this optimization window
+            param_ranges: Dict of parameter_name -> [values to test]
+            n_trials: Evaluation budget; defaults to ~2*sqrt(grid size)
+            n_workers: Optional thread count for study.optimize
+
+        Returns:
+            Tuple of (best_params, best_score)
+        """
+        grid_size = int(np.prod([len(v) for v in param_ranges.values()]))
+        if n_trials is None:
+            n_trials = min(grid_size, max(10, int(np.ceil(2 * np.sqrt(grid_size)))))
+
+        window_key = self._window_key(data_window)
+
+        def objective(trial):
+            params = {
+                name: trial.suggest_categorical(name, values)
+                for name, values in param_ranges.items()
+            }
+            key = (window_key, tuple(sorted(params.items())))
+            score = self._eval_cache.get(key)
+            if score is not None:
+                self.cache_hits += 1
+                self._eval_cache.move_to_end(key)
+                return score
+            self.cache_misses += 1
+            results = self.strategy_func(data_window, **params)
+            score = self._calculate_metric(results)
+            self._cache_store(key, score)
+            return score
+
+        study = optuna.create_study(
+            direction='maximize',
+            sampler=optuna.samplers.TPESampler(seed=42)
+        )
+        study.optimize(
+            objective,
+            n_trials=n_trials,
+            n_jobs=n_workers if n_workers else 1
+        )
+
+        return study.best_params, study.best_value
+
+    def _grid_eval_fast(
+        self,
+        data_window: pd.DataFrame,
+        param_grid: List[Dict]
+    ) -> Optional[np.ndarray]:
+        """Score the whole grid with the compiled kernel when possible
+        (see _fast_grid_scores)."""
+        return _fast_grid_scores(
+            self.strategy_func, data_window, param_grid,
+            self.optimization_metric
+        )
+
+    @staticmethod
+    def _precompute_mas(
+        data_window: pd.DataFrame,
+        param_grid: List[Dict]
+    ) -> Optional[Dict[int, np.ndarray]]:
+        """Compute each distinct MA length appearing in the grid once.
+
+        Returns None when the grid has no '*_ma' parameters or the
+        window has no Close column (strategy handles its own rolling).
+        """
+        ma_windows = sorted({
+            v for params in param_grid
+            for k, v in params.items() if k.endswith('_ma')
+        })
+        if not ma_windows or 'Close' not in data_window.columns:
+            return None
+        close = data_window['Close'].to_numpy(dtype=np.float64)
+        return {w: _move_mean(close, w) for w in ma_windows}
+
+    @staticmethod
+    def _window_key(data_window: pd.DataFrame) -> bytes:
+        """Content hash identifying a data window."""
+        return hashlib.blake2b(
+            np.ascontiguousarray(data_window.values).tobytes(),
+            digest_size=16
+        ).digest()
+
+    def _cache_store(self, key: tuple, score: float):
+        """Insert a score, evicting the least recently used entry."""
+        self._eval_cache[key] = score
+        if len(self._eval_cache) > self._eval_cache_size:
+            self._eval_cache.popitem(last=False)
+
     def _calculate_metric(self, results: Dict) -> float:
         """Calculate optimization metric from strategy results."""
-        if self.optimization_metric == 'sharpe':
-            return results.get('sharpe_ratio', -np.inf)
-        elif self.optimization_metric == 'cagr':
-            return results.get('cagr', -np.inf)
-        elif self.optimization_metric == 'calmar':
-            return results.get('calmar_ratio', -np.inf)
-        elif self.optimization_metric == 'profit_factor':
-            return results.get('profit_factor', 0)
-        else:
-            return results.get('total_return', -np.inf)
+        return self._metric_fn(results)
             
     def run_walk_forward(
         self,
@@ -166,32 +557,79 @@ class WalkForwardOptimizer:
         windows = self._generate_windows()
         print(f"\nTotal windows: {len(windows)}")
         
-        # Process each window
+        # Process each window. Windows are independent, so with
+        # parallel=True whole windows are fanned out across processes
+        # (batched to amortize pickling); within each worker the grid
+        # runs through the serial/compiled path to avoid
+        # oversubscription.
+        if (parallel and Parallel is not None and len(windows) > 1
+                and self.optimize_method == 'grid'):
+            batch_size = max(1, len(windows) // (n_workers * 4))
+            all_results = Parallel(n_jobs=n_workers, batch_size=batch_size)(
+                delayed(_process_window)(
+                    self.strategy_func,
+                    self.data.iloc[in_start:in_end],
+                    self.data.iloc[in_end:out_end],
+                    start_date, i + 1, param_grid,
+                    self.optimization_metric
+                )
+                for i, (in_start, in_end, out_end, start_date)
+                in enumerate(windows)
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                for result in all_results:
+                    logger.debug(
+                        "Window %d/%d (%s): in-sample %s %.3f, "
+                        "out-of-sample %.3f",
+                        result['window'], len(windows),
+                        result['start_date'].date(),
+                        self.optimization_metric,
+                        result['in_sample_score'],
+                        result['out_sample_score']
+                    )
+
+            results_df = pd.DataFrame(all_results)
+            self._print_summary(results_df)
+            return results_df
+
         all_results = []
-        
-        for i, (in_sample_data, out_sample_data, start_date) in enumerate(windows):
-            print(f"\n{'='*70}")
-            print(f"Window {i+1}/{len(windows)} - Starting {start_date.date()}")
-            print(f"{'='*70}")
-            
+
+        # Per-window chatter goes to logger.debug; progress is a single
+        # tqdm bar rather than ~10 printed lines per window
+        iterator = enumerate(windows)
+        if tqdm is not None:
+            iterator = tqdm(iterator, total=len(windows), desc='WFO')
+
+        for i, (in_start, in_end, out_end, start_date) in iterator:
+            in_sample_data = self.data.iloc[in_start:in_end]
+            out_sample_data = self.data.iloc[in_end:out_end]
+            logger.debug("Window %d/%d - starting %s",
+                         i + 1, len(windows), start_date.date())
+
             # Optimize on in-sample data
-            print("Optimizing parameters...")
-            best_params, in_sample_score = self.optimize_window(
-                in_sample_data,
-                param_grid
-            )
-            
-            print(f"Best parameters found:")
-            for key, value in best_params.items():
-                print(f"  {key}: {value}")
-            print(f"In-sample {self.optimization_metric}: {in_sample_score:.3f}")
+            if self.optimize_method == 'tpe':
+                best_params, in_sample_score = self.optimize_window_tpe(
+                    in_sample_data,
+                    param_ranges,
+                    n_workers=n_workers if parallel else None
+                )
+            else:
+                best_params, in_sample_score = self.optimize_window(
+                    in_sample_data,
+                    param_grid,
+                    n_workers=n_workers if parallel else None
+                )
             
+            logger.debug("Best parameters: %s (in-sample %s %.3f)",
+                         best_params, self.optimization_metric,
+                         in_sample_score)
+
             # Test on out-of-sample data
-            print("\nTesting on out-of-sample data...")
             out_sample_results = self.strategy_func(out_sample_data, **best_params)
             out_sample_score = self._calculate_metric(out_sample_results)
-            
-            print(f"Out-of-sample {self.optimization_metric}: {out_sample_score:.3f}")
+
+            logger.debug("Out-of-sample %s: %.3f",
+                         self.optimization_metric, out_sample_score)
             
             # Store results
             window_result = {
@@ -215,29 +653,36 @@ class WalkForwardOptimizer:
         
         return results_df
         
-    def _generate_windows(self) -> List[Tuple[pd.DataFrame, pd.DataFrame, datetime]]:
-        """Generate in-sample and out-of-sample windows."""
+    def _generate_windows(self) -> List[Tuple[int, int, int, datetime]]:
+        """Generate in-sample and out-of-sample window boundaries.
+
+        Returns (in_start, in_end, out_end, start_date) tuples rather
+        than sliced DataFrames: the caller slices lazily per window
+        (range .iloc slices are views, not copies), and the boundary
+        list is memoized across run_walk_forward calls.
+        """
+        key = (len(self.data), self.in_sample_days,
+               self.out_sample_days, self.step_days)
+        if self._windows_key == key:
+            return self._windows
+
         windows = []
-        
         start_idx = 0
         data_length = len(self.data)
-        
+
         while start_idx + self.in_sample_days + self.out_sample_days <= data_length:
-            # In-sample window
             in_sample_end = start_idx + self.in_sample_days
-            in_sample_data = self.data.iloc[start_idx:in_sample_end]
-            
-            # Out-of-sample window
             out_sample_end = in_sample_end + self.out_sample_days
-            out_sample_data = self.data.iloc[in_sample_end:out_sample_end]
-            
-            start_date = self.data.index[start_idx]
-            
-            windows.append((in_sample_data, out_sample_data, start_date))
-            
+            windows.append((
+                start_idx, in_sample_end, out_sample_end,
+                self.data.index[start_idx]
+            ))
+
             # Roll forward
             start_idx += self.step_days
-            
+
+        self._windows = windows
+        self._windows_key = key
         return windows
         
     def _print_summary(self, results: pd.DataFrame):
@@ -264,16 +709,19 @@ class WalkForwardOptimizer:
         print(f"  Mean degradation: {results['degradation'].mean():.3f}")
         print(f"  % Positive out-sample: {(results['out_sample_score'] > 0).mean()*100:.1f}%")
         
-        # Stability of parameters
+        # Stability of parameters: aggregate all columns in one pass,
+        # then print from the small stats frame
         param_cols = [col for col in results.columns if col.startswith('param_')]
         if param_cols:
+            param_stats = results[param_cols].agg(['mean', 'std'])
+            modes = results[param_cols].mode().iloc[0]
             print(f"\nPARAMETER STABILITY:")
             for col in param_cols:
                 param_name = col.replace('param_', '')
                 print(f"  {param_name}:")
-                print(f"    Mean: {results[col].mean():.2f}")
-                print(f"    Std: {results[col].std():.2f}")
-                print(f"    Most common: {results[col].mode()[0]}")
+                print(f"    Mean: {param_stats.at['mean', col]:.2f}")
+                print(f"    Std: {param_stats.at['std', col]:.2f}")
+                print(f"    Most common: {modes[col]}")
                 
     def get_robust_parameters(
         self,
@@ -322,28 +770,24 @@ class WalkForwardOptimizer:
             DataFrame with sensitivity metrics
         """
         param_cols = [col for col in results.columns if col.startswith('param_')]
-        
-        sensitivity = []
-        
-        for param_col in param_cols:
-            param_name = param_col.replace('param_', '')
-            
-            # Calculate correlation with out-sample performance
-            correlation = results[param_col].corr(results['out_sample_score'])
-            
-            # Calculate coefficient of variation
-            cv = results[param_col].std() / results[param_col].mean() if results[param_col].mean() != 0 else 0
-            
-            sensitivity.append({
-                'parameter': param_name,
-                'correlation_with_performance': correlation,
-                'coefficient_of_variation': cv,
-                'mean': results[param_col].mean(),
-                'std': results[param_col].std(),
-                'range': results[param_col].max() - results[param_col].min()
-            })
-            
-        return pd.DataFrame(sensitivity)
+        if not param_cols:
+            return pd.DataFrame()
+
+        # One vectorized pass over all parameter columns instead of
+        # recomputing each statistic per column in Python
+        params = results[param_cols]
+        correlation = params.corrwith(results['out_sample_score'])
+        stats = params.agg(['mean', 'std', 'min', 'max']).T
+        cv = (stats['std'] / stats['mean'].replace(0, np.nan)).fillna(0)
+
+        return pd.DataFrame({
+            'parameter': [col.replace('param_', '') for col in param_cols],
+            'correlation_with_performance': correlation.to_numpy(),
+            'coefficient_of_variation': cv.to_numpy(),
+            'mean': stats['mean'].to_numpy(),
+            'std': stats['std'].to_numpy(),
+            'range': (stats['max'] - stats['min']).to_numpy()
+        })
 
 
 def example_strategy_function(data: pd.DataFrame, **params) -> Dict:
@@ -360,26 +804,43 @@ def example_strategy_function(data: pd.DataFrame, **params) -> Dict:
     # Extract parameters
     fast_ma = params.get('fast_ma', 10)
     slow_ma = params.get('slow_ma', 30)
-    
-    # Calculate indicators
-    data['fast'] = data['Close'].rolling(fast_ma).mean()
-    data['slow'] = data['Close'].rolling(slow_ma).mean()
-    
-    # Generate signals
-    data['signal'] = np.where(data['fast'] > data['slow'], 1, -1)
-    
-    # Calculate returns
-    data['returns'] = data['Close'].pct_change()
-    data['strategy_returns'] = data['signal'].shift(1) * data['returns']
-    
-    # Calculate metrics
-    total_return = (1 + data['strategy_returns']).prod() - 1
-    sharpe = data['strategy_returns'].mean() / data['strategy_returns'].std() * np.sqrt(252)
-    
+
+    # Work on one flat array: each rolling/pct_change/where/shift on
+    # the DataFrame costs far more in pandas dispatch than the actual
+    # arithmetic, and column assignment fragments the caller's frame
+    close = data['Close'].to_numpy(dtype=np.float64)
+    n = close.size
+
+    # The optimizer precomputes each candidate MA once per window and
+    # shares the dict across the whole grid; standalone calls fall back
+    # to computing the two we need
+    precomputed = params.get('precomputed_mas')
+    if precomputed is not None:
+        fast = precomputed[fast_ma]
+        slow = precomputed[slow_ma]
+    else:
+        fast = _move_mean(close, fast_ma)
+        slow = _move_mean(close, slow_ma)
+
+    # NaN comparisons are False, so the warmup rows get -1 exactly as
+    # np.where did on the rolling columns
+    signal = np.where(fast > slow, 1.0, -1.0)
+
+    # Strategy returns: yesterday's signal times today's return
+    rets = np.diff(close) / close[:-1]
+    strategy_returns = signal[:-1] * rets
+
+    # Calculate metrics (log-space product for numerical stability)
+    total_return = np.expm1(np.log1p(strategy_returns).sum())
+    sharpe = (
+        strategy_returns.mean() / strategy_returns.std(ddof=1)
+        * np.sqrt(252)
+    )
+
     return {
         'total_return': total_return,
         'sharpe_ratio': sharpe,
-        'cagr': (1 + total_return) ** (252 / len(data)) - 1
+        'cagr': (1 + total_return) ** (252 / n) - 1
     }
 
 